@@ -1,38 +1,91 @@
+import importlib
+import threading
+from typing import Any, List
+
 from sportmonks_py.utils.config import Config
-from sportmonks_py.fixture import FixturesClient
-from sportmonks_py.teams import TeamsClient
-from sportmonks_py.odds import OddsClient
-from sportmonks_py.leagues import LeaguesClient
-from sportmonks_py.standings import StandingsClient
-from sportmonks_py.misc import OtherClient
-from sportmonks_py.core import CoreClient
+from sportmonks_py.utils.errors import ApiTokenMissingError
+from sportmonks_py.client.session import Session
+
+# Client attribute name -> (module, class). Clients are imported and created on first access.
+_CLIENT_CLASSES = {
+    "fixtures": ("sportmonks_py.fixture", "FixturesClient"),
+    "odds": ("sportmonks_py.odds", "OddsClient"),
+    "teams": ("sportmonks_py.teams", "TeamsClient"),
+    "leagues": ("sportmonks_py.leagues", "LeaguesClient"),
+    "standings": ("sportmonks_py.standings", "StandingsClient"),
+    "other": ("sportmonks_py.misc", "OtherClient"),
+    "core": ("sportmonks_py.core", "CoreClient"),
+}
 
 
 class APIClient:
     def __init__(self, sport: str, api_token: str):
         """
-        Initialize client-specific clients.
+        Initialize client-specific clients. All clients share a single pooled
+        HTTP session so connections to the API are re-used between them. Each
+        client is only imported and created when it is first accessed.
 
         :param sport: Sport being requested.
         :param api_token: API token for authenticating requests.
         """
+        if not api_token:
+            raise ApiTokenMissingError("API token is required.")
 
         # Base URLs for sport and core
-        base_urls = {
+        self._base_urls = {
             "core": f"{Config.BASE_URL}/",
             "sport": f"{Config.BASE_URL}{sport}/",
         }
+        self._api_token = api_token
+        self.session = Session()
+        self._clients_lock = threading.Lock()
 
-        client_classes = {
-            "fixtures": FixturesClient,
-            "odds": OddsClient,
-            "teams": TeamsClient,
-            "leagues": LeaguesClient,
-            "standings": StandingsClient,
-            "other": OtherClient,
-            "core": CoreClient,
-        }
+    def __getattr__(self, name: str) -> Any:
+        try:
+            module_name, class_name = _CLIENT_CLASSES[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+        with self._clients_lock:
+            # Another thread may have created the client while waiting for the lock
+            client = self.__dict__.get(name)
+            if client is None:
+                client_cls = getattr(importlib.import_module(module_name), class_name)
+                base_url = (
+                    self._base_urls["core"]
+                    if name == "core"
+                    else self._base_urls["sport"]
+                )
+                client = client_cls(base_url, self._api_token, session=self.session)
+                object.__setattr__(self, name, client)
+        return client
+
+    def close(self) -> None:
+        """
+        Close the HTTP session shared by all clients.
+        """
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP session shared by all clients, including the async client
+        of the running event loop.
+        """
+        await self.session.aclose()
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "APIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
-        for attr_name, client_cls in client_classes.items():
-            base_url = base_urls["core"] if attr_name == "core" else base_urls["sport"]
-            setattr(self, attr_name, client_cls(base_url, api_token))
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | _CLIENT_CLASSES.keys())
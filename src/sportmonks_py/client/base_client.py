@@ -1,9 +1,23 @@
+import asyncio
+import concurrent.futures
+import functools
 import json
-import http.client
+import threading
 import urllib.parse
-import aiohttp
-from typing import Dict, Iterable, Any, Optional, AsyncIterator, Union, Iterator
+from typing import (
+    Dict,
+    Iterable,
+    Any,
+    Optional,
+    AsyncIterator,
+    Union,
+    Iterator,
+    Tuple,
+)
 
+from sportmonks_py.client.session import Session
+from sportmonks_py.utils.cache import TTLCache
+from sportmonks_py.utils.config import Config
 from sportmonks_py.utils.errors import (
     status_code_to_exception,
     ApiTokenMissingError,
@@ -18,13 +32,92 @@ from sportmonks_py.utils.common_types import (
 )
 
 
+def _build_query(
+    params: Optional[Dict[str, Any]],
+    includes: Optional[Includes],
+    selects: Optional[Selects],
+    filters: Optional[Filters],
+    locale: Optional[str] = None,
+    order: Optional[Ordering] = None,
+) -> str:
+    params = dict(params or {})
+
+    if includes:
+        params["include"] = ";".join(includes)
+    if selects:
+        params["select"] = json.dumps(selects, separators=(",", ":"))
+    if filters:
+        params.update({f"filter[{k}]": v for k, v in filters.items()})
+    if locale:
+        params.update({"locale": locale})
+    if order:
+        params.update({"order": order})
+
+    params = {k: v for k, v in params.items() if v}
+
+    return urllib.parse.urlencode(params, doseq=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_query(frozen_query: Tuple[Any, ...]) -> str:
+    """
+    Memoized query string encoding, so repeated calls with the same parameters
+    (e.g. polling an endpoint with fixed includes and filters) encode them once.
+    """
+    return _build_query(*_thaw(frozen_query))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested dicts and lists into hashable tuples, tagged by type. Scalars are
+    tagged too, since values such as 1, 1.0 and True compare and hash equal but
+    encode differently.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _thaw(value: Any) -> Any:
+    """Reverse of _freeze."""
+    value_type, frozen = value
+    if value_type is dict:
+        return {_thaw(k): _thaw(v) for k, v in frozen}
+    if value_type in (list, tuple):
+        return value_type(_thaw(v) for v in frozen)
+    return frozen
+
+
 class BaseClient:
-    def __init__(self, base_url: str, api_token: str):
+    __slots__ = (
+        "base_url",
+        "_url_prefix",
+        "api_token",
+        "session",
+        "_cache",
+        "_inflight",
+        "_inflight_lock",
+        "_async_inflight",
+    )
+
+    def __init__(
+        self, base_url: str, api_token: str, session: Optional[Session] = None
+    ):
         if not api_token:
             raise ApiTokenMissingError("API token is required.")
 
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = f"{self.base_url}/"
         self.api_token = api_token
+        self.session = session if session is not None else Session()
+        self._cache = TTLCache(maxsize=Config.CACHE_MAXSIZE)
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._async_inflight: Dict[
+            Tuple[asyncio.AbstractEventLoop, str], asyncio.Future
+        ] = {}
 
     def _get(
         self,
@@ -36,84 +129,208 @@ class BaseClient:
         async_mode: bool = False,
         locale: Optional[str] = None,
         order: Optional[Ordering] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Union[Iterable[Response], AsyncIterator[Response]]:
         """
         If async_mode=False, returns a synchronous iterator over API results.
         If async_mode=True, returns an asynchronous iterator over API results.
         Locale defaults to English if not selected or an invalid locale is provided.
+        If cache_ttl is set, responses are cached per URL for that many seconds.
         """
         url = self._build_url(
             endpoint, params, includes, selects, filters, locale, order
         )
 
         if async_mode:
-            return self._get_async_generator(url)
+            return self._get_async_generator(url, cache_ttl)
         else:
-            return self._get_sync_generator(url)
+            return self._get_sync_generator(url, cache_ttl)
 
-    def _get_sync_generator(self, initial_url: str) -> Iterator[Response]:
+    def _get_sync_generator(
+        self, initial_url: str, cache_ttl: Optional[float] = None
+    ) -> Iterator[Response]:
         """
-        Synchronous generator that yields results from the API.
+        Synchronous generator that yields results from the API. The next page is
+        fetched in the background while the current page is being consumed.
         """
         url = initial_url
-        while url:
-            try:
-                response_data = self._make_request(url)
-                message = response_data.get("message")
-                if message:
-                    yield {"message": message}
-                else:
-                    yield response_data["data"]
-                pagination = response_data.get("pagination", {})
-                url = (
-                    pagination.get("next_page") if pagination.get("has_more") else None
-                )
-            except Exception as e:
-                raise ValueError(f"Error processing URL {url}: {e}")
-
-    async def _get_async_generator(self, initial_url: str) -> AsyncIterator[Response]:
+        next_page: Optional[concurrent.futures.Future] = None
+        executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        try:
+            while url:
+                try:
+                    if next_page is not None:
+                        response_data = next_page.result()
+                    else:
+                        response_data = self._make_request(url, cache_ttl)
+                    next_url = self._next_page_url(response_data)
+                    if next_url:
+                        if executor is None:
+                            executor = concurrent.futures.ThreadPoolExecutor(
+                                max_workers=1
+                            )
+                        next_page = executor.submit(
+                            self._make_request, next_url, cache_ttl
+                        )
+                    message = response_data.get("message")
+                    if message:
+                        yield {"message": message}
+                    else:
+                        yield response_data["data"]
+                    url = next_url
+                except Exception as e:
+                    raise ValueError(f"Error processing URL {url}: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _get_async_generator(
+        self, initial_url: str, cache_ttl: Optional[float] = None
+    ) -> AsyncIterator[Response]:
         """
-        Asynchronous generator that yields results from the API.
+        Asynchronous generator that yields results from the API. The next page is
+        fetched in the background while the current page is being consumed.
         """
         url = initial_url
-        while url:
-            try:
-                response_data = await self._make_request_async(url)
-                message = response_data.get("message")
-                if message:
-                    yield {"message": message}
+        next_page: Optional[asyncio.Task] = None
+        try:
+            while url:
+                try:
+                    if next_page is not None:
+                        response_data = await next_page
+                    else:
+                        response_data = await self._make_request_async(url, cache_ttl)
+                    next_url = self._next_page_url(response_data)
+                    next_page = (
+                        asyncio.ensure_future(
+                            self._make_request_async(next_url, cache_ttl)
+                        )
+                        if next_url
+                        else None
+                    )
+                    message = response_data.get("message")
+                    if message:
+                        yield {"message": message}
+                    else:
+                        yield response_data["data"]
+                    url = next_url
+                except Exception as e:
+                    raise MalformedResponseError(
+                        f"Error in endpoint response, missing : {e} from {url}. Re-check the requested parameters"
+                    )
+        finally:
+            if next_page is not None:
+                if next_page.done():
+                    if not next_page.cancelled():
+                        # Mark any error from the unused page as retrieved
+                        next_page.exception()
                 else:
-                    yield response_data["data"]
-                pagination = response_data.get("pagination", {})
-                url = (
-                    pagination.get("next_page") if pagination.get("has_more") else None
-                )
-            except Exception as e:
-                raise MalformedResponseError(
-                    f"Error in endpoint response, missing : {e} from {url}. Re-check the requested parameters"
-                )
-
-    def _make_request(self, url: str) -> Dict[str, Any]:
-        parsed_url = urllib.parse.urlparse(url)
-        conn = http.client.HTTPSConnection(parsed_url.netloc)
-        path = parsed_url.path + (f"?{parsed_url.query}" if parsed_url.query else "")
-        conn.request("GET", path, headers=self._build_headers())
-        response = conn.getresponse()
-        response_content = response.read()
-
-        if response.status != 200:
-            raise status_code_to_exception(response.status, response_content)
-
-        return json.loads(response_content.decode("utf-8"))
-
-    async def _make_request_async(self, url: str) -> Dict[str, Any]:
-        headers = self._build_headers()
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                response_content = await response.read()
-                if response.status != 200:
-                    raise status_code_to_exception(response.status, response_content)
-                return json.loads(response_content.decode("utf-8"))
+                    next_page.cancel()
+
+    @staticmethod
+    def _next_page_url(response_data: Dict[str, Any]) -> Optional[str]:
+        pagination = response_data.get("pagination", {})
+        return pagination.get("next_page") if pagination.get("has_more") else None
+
+    def _make_request(
+        self, url: str, cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single page, serving it from the cache when enabled. Concurrent
+        requests for the same URL are coalesced into a single API call.
+        """
+        if cache_ttl:
+            cached = self._cache.get(url)
+            if cached is not None:
+                # The raw body is cached so each caller gets its own copy
+                return json.loads(cached)
+
+        with self._inflight_lock:
+            inflight = self._inflight.get(url)
+            if inflight is None:
+                self._inflight[url] = future = concurrent.futures.Future()
+
+        if inflight is not None:
+            # Each waiter parses the shared body into its own copy
+            return json.loads(inflight.result())
+
+        try:
+            response_content = self._fetch(url)
+            if cache_ttl:
+                self._cache.set(url, response_content, cache_ttl)
+            future.set_result(response_content)
+            return json.loads(response_content)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[url]
+
+    async def _make_request_async(
+        self, url: str, cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single page, serving it from the cache when enabled. Concurrent
+        requests for the same URL are coalesced into a single API call.
+        """
+        if cache_ttl:
+            cached = self._cache.get(url)
+            if cached is not None:
+                # The raw body is cached so each caller gets its own copy
+                return json.loads(cached)
+
+        loop = asyncio.get_running_loop()
+        key = (loop, url)
+        inflight = self._async_inflight.get(key)
+        if inflight is not None:
+            try:
+                # Each waiter parses the shared body into its own copy
+                return json.loads(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request being waited on was cancelled (e.g. an abandoned
+                # page prefetch), so make the request instead
+                return await self._make_request_async(url, cache_ttl)
+
+        self._async_inflight[key] = future = loop.create_future()
+        try:
+            response_content = await self._fetch_async(url)
+            if cache_ttl:
+                self._cache.set(url, response_content, cache_ttl)
+            future.set_result(response_content)
+            return json.loads(response_content)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no other request awaited it
+            future.exception()
+            raise
+        finally:
+            del self._async_inflight[key]
+
+    def _fetch(self, url: str) -> bytes:
+        response = self.session.client.get(url, headers=self._build_headers())
+        response_content = response.content
+
+        if response.status_code != 200:
+            raise status_code_to_exception(response.status_code, response_content)
+
+        return response_content
+
+    async def _fetch_async(self, url: str) -> bytes:
+        response = await self.session.async_client.get(
+            url, headers=self._build_headers()
+        )
+        response_content = response.content
+
+        if response.status_code != 200:
+            raise status_code_to_exception(response.status_code, response_content)
+
+        return response_content
 
     def _build_url(
         self,
@@ -125,25 +342,20 @@ class BaseClient:
         locale: Optional[str] = None,
         order: Optional[Ordering] = None,
     ) -> str:
-        params = params or {}
-
-        if includes:
-            params["include"] = ";".join(includes)
-        if selects:
-            params["select"] = json.dumps(selects, separators=(",", ":"))
-        if filters:
-            params.update({f"filter[{k}]": v for k, v in filters.items()})
-        if locale:
-            params.update({"locale": locale})
-        if order:
-            params.update({"order": order})
-
-        params = {k: v for k, v in params.items() if v}
-
-        search_string = urllib.parse.urlencode(params, doseq=True)
+        query = (params, includes, selects, filters, locale, order)
+        if not (includes or selects or filters or (params and any(params.values()))):
+            # Nothing costly to encode, which is cheaper than the memoized lookup
+            search_string = _build_query(*query)
+        else:
+            try:
+                search_string = _encode_query(_freeze(query))
+            except TypeError:
+                # Unhashable parameter values cannot be memoized
+                search_string = _build_query(*query)
+
         encoded_endpoint = urllib.parse.quote(endpoint, safe="/")
 
-        url = f"{self.base_url}/{encoded_endpoint}"
+        url = self._url_prefix + encoded_endpoint
         if search_string:
             url = f"{url}?{search_string}"
 
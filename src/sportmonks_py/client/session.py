@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
+
+import httpx
+
+from sportmonks_py.utils.config import Config
+
+
+class Session:
+    """
+    Pooled HTTP clients shared between sub-clients so that connections to the
+    SportMonks API are kept alive and re-used for both sync and async requests.
+    HTTP/2 is negotiated where available, allowing concurrent requests to be
+    multiplexed over a single connection, and responses are requested compressed.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        :param transport: (Optional) Transport for sync requests, e.g. httpx.MockTransport.
+        :param async_transport: (Optional) Transport for async requests.
+        """
+        self.client = httpx.Client(
+            http2=Config.HTTP2,
+            limits=self._limits(),
+            timeout=Config.TIMEOUT,
+            transport=transport,
+        )
+        self._async_transport = async_transport
+        # One async client per event loop, with the generator closing it on loop shutdown
+        self._async_clients: Dict[
+            asyncio.AbstractEventLoop,
+            Tuple[httpx.AsyncClient, AsyncGenerator[None, None]],
+        ] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Async client for the running event loop. Connections cannot be shared
+        between event loops, so one client is kept per loop. Each client is closed
+        when its loop shuts down its async generators, as ``asyncio.run`` does, and
+        clients of closed loops are dropped.
+
+        :return: httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed_loop in [lp for lp in self._async_clients if lp.is_closed()]:
+                del self._async_clients[closed_loop]
+            entry = self._async_clients.get(loop)
+            if entry is None or entry[0].is_closed:
+                client = httpx.AsyncClient(
+                    http2=Config.HTTP2,
+                    limits=self._limits(),
+                    timeout=Config.TIMEOUT,
+                    transport=self._async_transport,
+                )
+                entry = self._async_clients[loop] = (client, self._closer(client))
+        return entry[0]
+
+    def close(self) -> None:
+        """
+        Close the sync client and any async clients whose event loop is not running
+        in the current thread. Use ``aclose`` from within a running event loop.
+        """
+        self.client.close()
+        for loop, client in self._pop_async_clients():
+            if loop.is_closed():
+                # Connections of a closed loop can no longer be closed gracefully
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                loop.run_until_complete(client.aclose())
+
+    async def aclose(self) -> None:
+        """
+        Close the sync client and the async client for the running event loop.
+        Clients of loops running in other threads are closed on their own loop.
+        """
+        self.client.close()
+        running_loop = asyncio.get_running_loop()
+        for loop, client in self._pop_async_clients():
+            if loop is running_loop:
+                await client.aclose()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    def _pop_async_clients(
+        self,
+    ) -> List[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]]:
+        with self._lock:
+            clients = [(loop, entry[0]) for loop, entry in self._async_clients.items()]
+            self._async_clients.clear()
+        return clients
+
+    @staticmethod
+    def _closer(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+        """
+        Start a generator that closes ``client`` once finalised. Its first step
+        registers it with the running loop, which closes it on shutdown.
+        """
+
+        async def close_on_shutdown() -> AsyncGenerator[None, None]:
+            try:
+                yield
+            finally:
+                await client.aclose()
+
+        closer = close_on_shutdown()
+        try:
+            closer.asend(None).send(None)
+        except StopIteration:
+            pass
+        return closer
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=Config.MAX_CONNECTIONS,
+            max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.KEEPALIVE_EXPIRY,
+        )
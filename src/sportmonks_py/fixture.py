@@ -1,5 +1,6 @@
 from typing import Union, List, Optional
 from sportmonks_py.client.base_client import BaseClient
+from sportmonks_py.client.session import Session
 from sportmonks_py.utils.errors import ParameterLengthException, InvalidDateFormat
 from sportmonks_py.utils.helper import validate_date_format, validate_date_order
 from sportmonks_py.utils.common_types import (
@@ -17,14 +18,19 @@ class FixturesClient(BaseClient):
     A client for accessing fixture-related data from the SportMonks API.
     """
 
-    def __init__(self, base_url: str, api_token: str) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self, base_url: str, api_token: str, session: Optional[Session] = None
+    ) -> None:
         """
         Initialize the Fixture Client with a base_url, sport and API token.
 
         :param api_token: API token for authenticating requests.
         :param base_url: Base URL for the API.
+        :param session: (Optional) HTTP client shared with other sub-clients.
         """
-        super().__init__(base_url=base_url, api_token=api_token)
+        super().__init__(base_url=base_url, api_token=api_token, session=session)
 
     def get_all_fixtures(
         self,
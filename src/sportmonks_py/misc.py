@@ -1,6 +1,7 @@
 from typing import Optional, Union
 
 from sportmonks_py.client.base_client import BaseClient
+from sportmonks_py.client.session import Session
 from sportmonks_py.utils.common_types import (
     Includes,
     Selects,
@@ -16,14 +17,19 @@ class OtherClient(BaseClient):
     A client for accessing fixture-related data from the SportMonks API.
     """
 
-    def __init__(self, base_url: str, api_token: str) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self, base_url: str, api_token: str, session: Optional[Session] = None
+    ) -> None:
         """
         Initialize the Miscellaneous Client (Other endpoint) with a base_url, sport and API token.
 
         :param api_token: API token for authenticating requests.
         :param base_url: Base URL for the API.
+        :param session: (Optional) HTTP client shared with other sub-clients.
         """
-        super().__init__(base_url=base_url, api_token=api_token)
+        super().__init__(base_url=base_url, api_token=api_token, session=session)
 
     def get_prematch_news(
         self,
@@ -1,6 +1,7 @@
 from typing import Union, Optional
 from sportmonks_py.utils.common_types import StdResponse, AsyncResponse, Ordering
 from sportmonks_py.client.base_client import BaseClient
+from sportmonks_py.client.session import Session
 
 
 class MyClient(BaseClient):
@@ -8,14 +9,19 @@ class MyClient(BaseClient):
     A client for accessing common endpoints data from the SportMonks API.
     """
 
-    def __init__(self, base_url: str, api_token: str) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self, base_url: str, api_token: str, session: Optional[Session] = None
+    ) -> None:
         """
         Initialize the My Client with a base_url and API token.
 
         :param api_token: API token for authenticating requests.
         :param base_url: Base URL for the API.
+        :param session: (Optional) HTTP client shared with other sub-clients.
         """
-        super().__init__(base_url=base_url, api_token=api_token)
+        super().__init__(base_url=base_url, api_token=api_token, session=session)
 
     def enrichments(
         self, async_mode: bool = False, order: Optional[Ordering] = None
@@ -1,6 +1,10 @@
-from typing import Optional, Union
+import asyncio
+from typing import Any, Dict, List, Optional, Union
 
 from sportmonks_py.client.base_client import BaseClient
+from sportmonks_py.client.session import Session
+from sportmonks_py.utils.config import Config
+from sportmonks_py.utils.helper import validate_positive_id
 from sportmonks_py.utils.common_types import (
     Includes,
     Selects,
@@ -11,19 +15,66 @@ from sportmonks_py.utils.common_types import (
 )
 
 
+_PREMATCH_URLS = {
+    "bookmaker": "odds/pre-match/fixtures/%s/bookmakers/%s",
+    "market": "odds/pre-match/fixtures/%s/markets/%s",
+    None: "odds/pre-match/fixtures/%s",
+}
+
+_INPLAY_URLS = {
+    "bookmaker": "odds/inplay/fixtures/%s/bookmakers/%s",
+    "market": "odds/inplay/fixtures/%s/markets/%s",
+    None: "odds/inplay/fixtures/%s",
+}
+
+_PREMIUM_PREMATCH_URLS = {
+    "bookmaker": "odds/premium/pre-match/fixtures/%s/bookmakers/%s",
+    "market": "odds/premium/pre-match/fixtures/%s/markets/%s",
+    None: "odds/premium/pre-match/fixtures/%s",
+}
+
+
+def _fixture_odds_endpoint(
+    templates: Dict[Optional[str], str],
+    fixture_id: int,
+    bookmaker_id: Optional[int],
+    market_id: Optional[int],
+) -> str:
+    """
+    Select the fixture odds endpoint, filtered by bookmaker or market (bookmaker takes precedence).
+
+    :param templates: Endpoint templates keyed by "bookmaker", "market" or None.
+    :param fixture_id: ID of the fixture.
+    :param bookmaker_id: (Optional) ID of the bookmaker.
+    :param market_id: (Optional) ID of the market.
+
+    :return: str
+    """
+    if bookmaker_id is not None:
+        return templates["bookmaker"] % (fixture_id, bookmaker_id)
+    if market_id is not None:
+        return templates["market"] % (fixture_id, market_id)
+    return templates[None] % (fixture_id,)
+
+
 class OddsClient(BaseClient):
     """
     A client for accessing odds-related data from the SportMonks API.
     """
 
-    def __init__(self, base_url: str, api_token: str) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self, base_url: str, api_token: str, session: Optional[Session] = None
+    ) -> None:
         """
         Initialize the Odds Client with a base_url, sport and API token.
 
         :param api_token: API token for authenticating requests.
         :param base_url: Base URL for the API.
+        :param session: (Optional) HTTP client shared with other sub-clients.
         """
-        super().__init__(base_url=base_url, api_token=api_token)
+        super().__init__(base_url=base_url, api_token=api_token, session=session)
 
     def get_all_prematch_odds(
         self,
@@ -33,6 +84,7 @@ class OddsClient(BaseClient):
         async_mode: bool = False,
         locale: Optional[str] = None,
         order: Optional[Ordering] = None,
+        no_cache: bool = False,
     ) -> Union[StdResponse, AsyncResponse]:
         """
         Retrieve all available pre-match odds.
@@ -43,6 +95,7 @@ class OddsClient(BaseClient):
         :param async_mode: Whether to use async mode.
         :param locale: Locale to use for the response.
         :param order: Order to sort the results in (asc or desc).
+        :param no_cache: Bypass the response cache (responses are cached for 60 seconds).
 
         :return: StdResponse | AsyncResponse
         """
@@ -51,6 +104,7 @@ class OddsClient(BaseClient):
             params={"include": includes, "select": selects, "filter": filters},
             async_mode=async_mode,
             locale=locale,
+            cache_ttl=None if no_cache else Config.PREMATCH_ODDS_CACHE_TTL,
         )
 
     def get_fixture_prematch_odds(
@@ -80,30 +134,73 @@ class OddsClient(BaseClient):
 
         :return: StdResponse | AsyncResponse
         """
-        if bookmaker_id:
-            return self._get(
-                f"odds/pre-match/fixtures/{fixture_id}/bookmakers/{bookmaker_id}",
-                params={"include": includes, "select": selects, "filter": filters},
-                async_mode=async_mode,
-                locale=locale,
-                order=order,
-            )
-        if market_id:
-            return self._get(
-                f"odds/pre-match/fixtures/{fixture_id}/markets/{market_id}",
-                params={"include": includes, "select": selects, "filter": filters},
-                async_mode=async_mode,
-                locale=locale,
-                order=order,
-            )
         return self._get(
-            f"odds/pre-match/fixtures/{fixture_id}",
+            _fixture_odds_endpoint(_PREMATCH_URLS, fixture_id, bookmaker_id, market_id),
             params={"include": includes, "select": selects, "filter": filters},
             async_mode=async_mode,
             locale=locale,
             order=order,
         )
 
+    async def get_many_fixture_prematch_odds(
+        self,
+        fixture_ids: List[int],
+        bookmaker_id: Optional[int] = None,
+        market_id: Optional[int] = None,
+        includes: Optional[Includes] = None,
+        selects: Optional[Selects] = None,
+        filters: Optional[Filters] = None,
+        locale: Optional[str] = None,
+        order: Optional[Ordering] = None,
+        concurrency: int = 16,
+    ) -> Dict[int, List[Any]]:
+        """
+        Retrieve pre-match odds for multiple fixtures concurrently. At most `concurrency`
+        fixtures are requested at once. Optionally filter by bookmaker or market.
+        If any fixture fails, the remaining requests are cancelled and the error is raised.
+
+        :param fixture_ids: IDs of the fixtures.
+        :param bookmaker_id: (Optional) ID of the bookmaker.
+        :param market_id: (Optional) ID of the market.
+        :param includes: Objects to include in the response.
+        :param selects: Fields to include or exclude in the response.
+        :param filters: Filters to apply to the results.
+        :param locale: Locale to use for the response.
+        :param order: Order to sort the results in (asc or desc).
+        :param concurrency: Maximum number of fixtures to request at once.
+
+        :return: Dict mapping each fixture ID to its list of response pages.
+        """
+        validate_positive_id(concurrency, "concurrency")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(fixture_id: int) -> List[Any]:
+            async with semaphore:
+                return [
+                    page
+                    async for page in self.get_fixture_prematch_odds(
+                        fixture_id,
+                        bookmaker_id=bookmaker_id,
+                        market_id=market_id,
+                        includes=includes,
+                        selects=selects,
+                        filters=filters,
+                        async_mode=True,
+                        locale=locale,
+                        order=order,
+                    )
+                ]
+
+        tasks = [asyncio.ensure_future(fetch(fixture_id)) for fixture_id in fixture_ids]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining fixtures rather than leaving them running
+            for task in tasks:
+                task.cancel()
+            raise
+        return dict(zip(fixture_ids, pages))
+
     def get_latest_prematch_odds(
         self,
         includes: Optional[Includes] = None,
@@ -112,6 +209,7 @@ class OddsClient(BaseClient):
         async_mode: bool = False,
         locale: Optional[str] = None,
         order: Optional[Ordering] = None,
+        no_cache: bool = False,
     ) -> Union[StdResponse, AsyncResponse]:
         """
         Retrieve pre-match odds for fixtures updated within the last 10 seconds.
@@ -122,6 +220,7 @@ class OddsClient(BaseClient):
         :param async_mode: Whether to use async mode.
         :param locale: Locale to use for the response.
         :param order: Order to sort the results in (asc or desc).
+        :param no_cache: Bypass the response cache (responses are cached for 8 seconds).
 
         :return: StdResponse | AsyncResponse
         """
@@ -131,6 +230,7 @@ class OddsClient(BaseClient):
             async_mode=async_mode,
             locale=locale,
             order=order,
+            cache_ttl=None if no_cache else Config.LATEST_ODDS_CACHE_TTL,
         )
 
     def get_all_inplay_odds(
@@ -189,24 +289,8 @@ class OddsClient(BaseClient):
 
         :return: StdResponse | AsyncResponse
         """
-        if bookmaker_id:
-            return self._get(
-                f"odds/inplay/fixtures/{fixture_id}/bookmakers/{bookmaker_id}",
-                params={"include": includes, "select": selects, "filter": filters},
-                async_mode=async_mode,
-                locale=locale,
-                order=order,
-            )
-        if market_id:
-            return self._get(
-                f"odds/inplay/fixtures/{fixture_id}/markets/{market_id}",
-                params={"include": includes, "select": selects, "filter": filters},
-                async_mode=async_mode,
-                locale=locale,
-                order=order,
-            )
         return self._get(
-            f"odds/inplay/fixtures/{fixture_id}",
+            _fixture_odds_endpoint(_INPLAY_URLS, fixture_id, bookmaker_id, market_id),
             params={"include": includes, "select": selects, "filter": filters},
             async_mode=async_mode,
             locale=locale,
@@ -221,6 +305,7 @@ class OddsClient(BaseClient):
         async_mode: bool = False,
         locale: Optional[str] = None,
         order: Optional[Ordering] = None,
+        no_cache: bool = False,
     ) -> Union[StdResponse, AsyncResponse]:
         """
         Retrieve in-play odds for fixtures updated within the last 10 seconds.
@@ -231,6 +316,7 @@ class OddsClient(BaseClient):
         :param async_mode: Whether to use async mode.
         :param locale: Locale to use for the response.
         :param order: Order to sort the results in (asc or desc).
+        :param no_cache: Bypass the response cache (responses are cached for 8 seconds).
 
         :return: StdResponse | AsyncResponse
         """
@@ -240,6 +326,7 @@ class OddsClient(BaseClient):
             async_mode=async_mode,
             locale=locale,
             order=order,
+            cache_ttl=None if no_cache else Config.LATEST_ODDS_CACHE_TTL,
         )
 
     def get_premium_fixture_prematch_odds(
@@ -273,24 +360,10 @@ class OddsClient(BaseClient):
 
         :return: StdResponse | AsyncResponse
         """
-        if bookmaker_id:
-            return self._get(
-                f"odds/premium/pre-match/fixtures/{fixture_id}/bookmakers/{bookmaker_id}",
-                params={"include": includes, "select": selects, "filter": filters},
-                async_mode=async_mode,
-                locale=locale,
-                order=order,
-            )
-        if market_id:
-            return self._get(
-                f"odds/premium/pre-match/fixtures/{fixture_id}/markets/{market_id}",
-                params={"include": includes, "select": selects, "filter": filters},
-                async_mode=async_mode,
-                locale=locale,
-                order=order,
-            )
         return self._get(
-            f"odds/premium/pre-match/fixtures/{fixture_id}",
+            _fixture_odds_endpoint(
+                _PREMIUM_PREMATCH_URLS, fixture_id, bookmaker_id, market_id
+            ),
             params={"include": includes, "select": selects, "filter": filters},
             async_mode=async_mode,
             locale=locale,
@@ -1,5 +1,15 @@
 class Config:
     BASE_URL = "https://api.sportmonks.com/v3/"
+    HTTP2 = True
+    MAX_CONNECTIONS = 50
+    MAX_KEEPALIVE_CONNECTIONS = 10
+    # Keep idle connections open between polls so DNS, TCP and TLS setup is not repeated
+    KEEPALIVE_EXPIRY = 60.0
+    TIMEOUT = 30.0
+    CACHE_MAXSIZE = 512
+    # Latest odds endpoints refresh every 10 seconds, expire slightly sooner
+    LATEST_ODDS_CACHE_TTL = 8
+    PREMATCH_ODDS_CACHE_TTL = 60
 
 
 config = Config()
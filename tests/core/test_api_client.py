@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sportmonks_py.client import APIClient
+from sportmonks_py.odds import OddsClient
+
+
+def test_client_is_created_on_first_access():
+    client = APIClient(sport="football", api_token="token")
+    odds = client.odds
+
+    assert isinstance(odds, OddsClient)
+    assert odds.session is client.session
+    assert odds.base_url == "https://api.sportmonks.com/v3/football"
+    assert client.odds is odds
+
+
+def test_concurrent_first_access_creates_one_client():
+    client = APIClient(sport="football", api_token="token")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: client.odds, range(32)))
+
+    assert all(odds is clients[0] for odds in clients)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    client = APIClient(sport="football", api_token="token")
+    with pytest.raises(AttributeError):
+        client.unknown
+
+
+def test_unused_client_modules_are_not_imported():
+    # Run in a fresh interpreter so modules imported by other tests do not interfere
+    code = (
+        "import sys\n"
+        "from sportmonks_py.client import APIClient\n"
+        "APIClient(sport='football', api_token='token').odds\n"
+        "assert 'sportmonks_py.odds' in sys.modules\n"
+        "assert 'sportmonks_py.fixture' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
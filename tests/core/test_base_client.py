@@ -0,0 +1,370 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import httpx
+import pytest
+
+from sportmonks_py.client.base_client import _build_query, _encode_query
+from sportmonks_py.client.session import Session
+from sportmonks_py.odds import OddsClient
+from sportmonks_py.utils.errors import MalformedResponseError
+
+BASE_URL = "https://api.sportmonks.com/v3/football/"
+
+
+class MockAPI:
+    """Records requests and answers each with a single page of data."""
+
+    def __init__(self, pages=None):
+        self.pages = pages or {}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        body = self.pages.get(
+            str(request.url),
+            {"data": [{"id": 1}], "pagination": {"has_more": False}},
+        )
+        return httpx.Response(200, json=body)
+
+
+@pytest.fixture
+def api():
+    return MockAPI()
+
+
+def make_odds(api):
+    transport = httpx.MockTransport(api)
+    return OddsClient(
+        BASE_URL,
+        "token",
+        session=Session(transport=transport, async_transport=transport),
+    )
+
+
+@pytest.fixture
+def odds(api):
+    return make_odds(api)
+
+
+def test_cached_response_is_served_without_request(odds, api):
+    list(odds.get_latest_prematch_odds())
+    list(odds.get_latest_prematch_odds())
+    assert len(api.requests) == 1
+
+
+def test_no_cache_bypasses_cache(odds, api):
+    list(odds.get_latest_prematch_odds())
+    list(odds.get_latest_prematch_odds(no_cache=True))
+    assert len(api.requests) == 2
+
+
+def test_cached_response_is_not_shared_between_calls(odds):
+    next(odds.get_latest_prematch_odds()).append("junk")
+    assert next(odds.get_latest_prematch_odds()) == [{"id": 1}]
+
+
+class BlockingAPI(MockAPI):
+    """Holds every request until released, so concurrent callers overlap."""
+
+    def __init__(self, pages=None):
+        super().__init__(pages)
+        self.release = threading.Event()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.release.wait(timeout=5)
+        return super().__call__(request)
+
+
+class AsyncBlockingAPI(MockAPI):
+    def __init__(self, pages=None):
+        super().__init__(pages)
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await self.release.wait()
+        return super().__call__(request)
+
+
+def test_concurrent_requests_are_coalesced():
+    api = BlockingAPI()
+    odds = make_odds(api)
+    url = f"{BASE_URL}odds/pre-match/fixtures/1"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(odds._make_request, url) for _ in range(5)]
+        time.sleep(0.1)
+        api.release.set()
+        results = [future.result() for future in futures]
+
+    assert len(api.requests) == 1
+    assert all(result == results[0] for result in results)
+    # Every caller gets its own copy of the response
+    assert len({id(result) for result in results}) == 5
+
+
+def test_failed_request_is_removed_from_inflight():
+    def handler(request):
+        raise httpx.ConnectError("unreachable", request=request)
+
+    odds = make_odds(handler)
+    url = f"{BASE_URL}odds/pre-match/fixtures/1"
+    with pytest.raises(httpx.ConnectError):
+        odds._make_request(url)
+    assert odds._inflight == {}
+
+
+def test_concurrent_async_requests_are_coalesced():
+    async def run():
+        api = AsyncBlockingAPI()
+        odds = make_odds(api)
+        url = f"{BASE_URL}odds/pre-match/fixtures/1"
+        tasks = [asyncio.ensure_future(odds._make_request_async(url)) for _ in range(5)]
+        await asyncio.sleep(0)
+        api.release.set()
+        return api, await asyncio.gather(*tasks)
+
+    api, results = asyncio.run(run())
+    assert len(api.requests) == 1
+    assert len({id(result) for result in results}) == 5
+
+
+def test_waiter_retries_when_coalesced_request_is_cancelled():
+    async def run():
+        api = AsyncBlockingAPI()
+        odds = make_odds(api)
+        url = f"{BASE_URL}odds/pre-match/fixtures/1"
+        leader = asyncio.ensure_future(odds._make_request_async(url))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(odds._make_request_async(url))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        api.release.set()
+        return api, leader, await waiter
+
+    api, leader, result = asyncio.run(run())
+    assert leader.cancelled()
+    assert result == {"data": [{"id": 1}], "pagination": {"has_more": False}}
+    assert len(api.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(1, "a=1"), (True, "a=True"), (1.0, "a=1.0"), ([1, True], "a=1&a=True")],
+)
+def test_query_memoization_keeps_value_types(odds, value, expected):
+    # Equal values of different types must not share a memoized query string
+    odds._build_url("x", {"a": 1}, None, None, None)
+    assert odds._build_url("x", {"a": value}, None, None, None) == (
+        f"{BASE_URL}x?{expected}"
+    )
+
+
+def test_query_memoization_matches_uncached_encoding(odds):
+    params = {"include": ["a", "b.c"], "filter": {"x": 1}}
+    assert odds._build_url(
+        "x", params, ["venue"], {"a": [1]}, {"k": "v"}, "es", "asc"
+    ) == (
+        f"{BASE_URL}x?"
+        + _build_query(params, ["venue"], {"a": [1]}, {"k": "v"}, "es", "asc")
+    )
+
+
+def test_query_memoization_keeps_key_types(odds):
+    odds._build_url("x", None, None, None, {1: "a"})
+    assert odds._build_url("x", None, None, None, {True: "a"}) == (
+        f"{BASE_URL}x?filter%5BTrue%5D=a"
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs, endpoint",
+    [
+        ({}, "odds/pre-match/fixtures/1"),
+        ({"bookmaker_id": 0}, "odds/pre-match/fixtures/1/bookmakers/0"),
+        ({"market_id": 0}, "odds/pre-match/fixtures/1/markets/0"),
+        ({"bookmaker_id": 2, "market_id": 3}, "odds/pre-match/fixtures/1/bookmakers/2"),
+    ],
+)
+def test_fixture_odds_endpoint_selection(odds, api, kwargs, endpoint):
+    list(odds.get_fixture_prematch_odds(fixture_id=1, **kwargs))
+    assert api.requests == [f"{BASE_URL}{endpoint}"]
+
+
+def paged_api(api_cls=MockAPI, page_count=3):
+    url = f"{BASE_URL}fixtures"
+    pages = {}
+    for page in range(1, page_count + 1):
+        page_url = url if page == 1 else f"{url}?page={page}"
+        pages[page_url] = {
+            "data": [{"id": page}],
+            "pagination": {
+                "has_more": page < page_count,
+                "next_page": f"{url}?page={page + 1}",
+            },
+        }
+    return api_cls(pages)
+
+
+def test_sync_generator_prefetches_next_page():
+    api = paged_api()
+    odds = make_odds(api)
+    pages = odds._get("fixtures")
+
+    assert next(pages) == [{"id": 1}]
+    deadline = time.monotonic() + 1
+    while len(api.requests) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The second page was requested before it was consumed
+    assert len(api.requests) == 2
+    assert list(pages) == [[{"id": 2}], [{"id": 3}]]
+    assert len(api.requests) == 3
+
+
+def test_sync_generator_stops_prefetching_when_closed():
+    api = paged_api()
+    odds = make_odds(api)
+    pages = odds._get("fixtures")
+
+    next(pages)
+    pages.close()
+    time.sleep(0.1)
+    assert f"{BASE_URL}fixtures?page=3" not in api.requests
+
+
+class AsyncFirstPageAPI(MockAPI):
+    """Answers the first page immediately and holds later pages until released."""
+
+    def __init__(self, pages=None):
+        super().__init__(pages)
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.requests:
+            await self.release.wait()
+        return super().__call__(request)
+
+
+def test_async_generator_yields_all_pages():
+    async def run():
+        api = paged_api()
+        odds = make_odds(api)
+        return [page async for page in odds._get("fixtures", async_mode=True)]
+
+    assert asyncio.run(run()) == [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+
+
+def test_async_generator_cancels_prefetch_when_closed():
+    async def run():
+        api = paged_api(AsyncFirstPageAPI)
+        odds = make_odds(api)
+        pages = odds._get("fixtures", async_mode=True)
+
+        assert await pages.__anext__() == [{"id": 1}]
+        await asyncio.sleep(0)
+        await pages.aclose()
+        await asyncio.sleep(0)
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        return api, odds, pending
+
+    api, odds, pending = asyncio.run(run())
+    assert not pending
+    assert len(api.requests) == 1
+    assert odds._async_inflight == {}
+
+
+def test_waiters_are_released_when_request_raises_base_exception():
+    class Interrupted(BaseException):
+        pass
+
+    async def run():
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            raise Interrupted()
+
+        odds = make_odds(handler)
+        url = f"{BASE_URL}odds/pre-match/fixtures/1"
+        leader = asyncio.ensure_future(odds._make_request_async(url))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(odds._make_request_async(url))
+        await asyncio.sleep(0)
+        release.set()
+        done, pending = await asyncio.wait({leader, waiter}, timeout=1)
+        return done, pending
+
+    done, pending = asyncio.run(run())
+    assert not pending
+    assert all(isinstance(task.exception(), Interrupted) for task in done)
+
+
+class ConcurrencyAPI(MockAPI):
+    """Records the peak number of requests being handled at once."""
+
+    def __init__(self, fail_fixture=None):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+        self.fail_fixture = fail_fixture
+        self.finished = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            fixture_id = int(request.url.path.rsplit("/", 1)[-1])
+            if fixture_id == self.fail_fixture:
+                raise httpx.ConnectError("unreachable", request=request)
+            await asyncio.sleep(0.05)
+            self.finished.append(fixture_id)
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"fixture_id": fixture_id}],
+                    "pagination": {"has_more": False},
+                },
+            )
+        finally:
+            self.active -= 1
+
+
+def test_get_many_fixture_prematch_odds_bounds_concurrency():
+    api = ConcurrencyAPI()
+    odds = make_odds(api)
+
+    result = asyncio.run(
+        odds.get_many_fixture_prematch_odds(fixture_ids=[1, 2, 3, 4, 5], concurrency=2)
+    )
+
+    assert api.peak == 2
+    assert result == {
+        fixture_id: [[{"fixture_id": fixture_id}]] for fixture_id in range(1, 6)
+    }
+
+
+def test_get_many_fixture_prematch_odds_cancels_remaining_on_failure():
+    api = ConcurrencyAPI(fail_fixture=1)
+    odds = make_odds(api)
+
+    async def run():
+        with pytest.raises(MalformedResponseError):
+            await odds.get_many_fixture_prematch_odds(fixture_ids=[1, 2, 3])
+        await asyncio.sleep(0.1)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert not asyncio.run(run())
+    assert api.finished == []
+
+
+def test_query_without_parameters_skips_memoization(odds):
+    _encode_query.cache_clear()
+    url = odds._build_url(
+        "x", {"include": None, "select": None, "filter": None}, None, None, None, "es"
+    )
+    assert url == f"{BASE_URL}x?locale=es"
+    assert _encode_query.cache_info().currsize == 0
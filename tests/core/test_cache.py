@@ -0,0 +1,24 @@
+import time
+
+from sportmonks_py.utils.cache import TTLCache
+
+
+def test_cache_returns_value_within_ttl():
+    cache = TTLCache()
+    cache.set("url", {"data": []}, ttl=60)
+    assert cache.get("url") == {"data": []}
+
+
+def test_cache_expires_entries():
+    cache = TTLCache()
+    cache.set("url", {"data": []}, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("url") is None
+
+
+def test_cache_evicts_oldest_entry():
+    cache = TTLCache(maxsize=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key, ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from sportmonks_py.client import APIClient
+from sportmonks_py.client.session import Session
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"data": []})
+
+
+@pytest.fixture
+def session():
+    transport = httpx.MockTransport(handler)
+    return Session(transport=transport, async_transport=transport)
+
+
+def test_async_client_is_reused_within_a_loop(session):
+    async def clients():
+        first = session.async_client
+        await first.get("https://api.sportmonks.com/v3/")
+        return first, session.async_client
+
+    first, second = asyncio.run(clients())
+    assert first is second
+
+
+def test_async_client_per_loop_across_threads(session):
+    clients = []
+
+    def run():
+        async def requests():
+            for _ in range(50):
+                await session.async_client.get("https://api.sportmonks.com/v3/")
+            return session.async_client
+
+        clients.append(asyncio.run(requests()))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 4
+
+
+def test_closed_async_client_is_replaced(session):
+    async def clients():
+        first = session.async_client
+        await first.aclose()
+        second = session.async_client
+        return first, second, second.is_closed
+
+    first, second, second_closed = asyncio.run(clients())
+    assert first is not second
+    assert not second_closed
+
+
+def test_async_clients_released_across_asyncio_runs(session):
+    async def request():
+        client = session.async_client
+        await client.get("https://api.sportmonks.com/v3/")
+        return client
+
+    clients = [asyncio.run(request()) for _ in range(20)]
+
+    assert len(session._async_clients) <= 1
+    assert all(client.is_closed for client in clients)
+
+
+def test_aclose_closes_clients(session):
+    async def close():
+        client = session.async_client
+        await session.aclose()
+        return client
+
+    assert asyncio.run(close()).is_closed
+    assert session.client.is_closed
+
+
+def test_api_client_context_managers():
+    with APIClient(sport="football", api_token="token") as client:
+        pass
+    assert client.session.client.is_closed
+
+    async def use():
+        async with APIClient(sport="football", api_token="token") as client:
+            async_client = client.session.async_client
+        return async_client
+
+    assert asyncio.run(use()).is_closed
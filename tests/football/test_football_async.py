@@ -23,3 +23,12 @@ async def test_async_get_generator_single_page(client):
 async def test_async_get_team_single_page(client):
     async for page in client.teams.get_teams(team_id=100, async_mode=True):
         assert page["name"] == "Ebbsfleet United"
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_fixture_prematch_odds(client):
+    odds = await client.odds.get_many_fixture_prematch_odds(
+        fixture_ids=[18538184], bookmaker_id=5
+    )
+    for page in odds[18538184]:
+        assert page[0]["market_description"] == "Match Winner"